@@ -7,18 +7,97 @@ except ImportError:
 from machine import Pin, SPI # pyright: ignore[reportMissingImports]
 from microfont import MicroFont
 
-nice_fonts = {
-    18: MicroFont("fonts/victor_B_18.mfnt"),
-    24: MicroFont("fonts/victor_B_24.mfnt"),
-    32: MicroFont("fonts/victor_B_32.mfnt"),
-    42: MicroFont("fonts/victor_B_42.mfnt"),
-    54: MicroFont("fonts/victor_B_54.mfnt"),
-    68: MicroFont("fonts/victor_B_68.mfnt"),
+_FONT_PATHS = {
+    18: "fonts/victor_B_18.mfnt",
+    24: "fonts/victor_B_24.mfnt",
+    32: "fonts/victor_B_32.mfnt",
+    42: "fonts/victor_B_42.mfnt",
+    54: "fonts/victor_B_54.mfnt",
+    68: "fonts/victor_B_68.mfnt",
 }
+_font_cache = {}
+
+class _LazyFonts:
+    """
+    Read-only mapping of point size to MicroFont.
+    Each font file is only opened the first time its size is looked up.
+    """
+    def __contains__(self, size):
+        return size in _FONT_PATHS
+
+    def __getitem__(self, size):
+        font = _font_cache.get(size)
+        if font is None:
+            # Keep the sparse glyph index in RAM so each glyph lookup is a single seek
+            font = _font_cache[size] = MicroFont(_FONT_PATHS[size], cache_index=True)
+        return font
+
+    def get(self, size, default=None):
+        return self[size] if size in _FONT_PATHS else default
+
+    def keys(self):
+        return _FONT_PATHS.keys()
+
+    def items(self):
+        return ((size, self[size]) for size in _FONT_PATHS)
+
+nice_fonts = _LazyFonts()
+
+@micropython.viper
+def _invert_bytes(src: ptr8, dst: ptr8, n: int):
+    """Write the bitwise inverse of the first n bytes of src into dst."""
+    # Both buffers are heap allocations, so they are word aligned; go 4 bytes at a time
+    src32 = ptr32(src)
+    dst32 = ptr32(dst)
+    words = n >> 2
+    for i in range(words):
+        dst32[i] = src32[i] ^ -1
+    for i in range(words << 2, n):
+        dst[i] = src[i] ^ 0xFF
+
+@micropython.viper
+def _rotate_hlsb(src: ptr8, dst: ptr8, width: int, height: int, angle: int):
+    """
+    Copy the black pixels of a MONO_HLSB frame into a white-filled dst, rotated clockwise
+    by 90, 180 or 270 degrees. All-white source bytes are skipped.
+    """
+    src_bw = (width + 7) >> 3
+    dst_bw = src_bw
+    if angle == 90 or angle == 270:
+        dst_bw = (height + 7) >> 3
+    for y in range(height):
+        row = y * src_bw
+        for bx in range(src_bw):
+            b = int(src[row + bx])
+            if b == 0xFF:
+                continue
+            for bit in range(8):
+                x = (bx << 3) + bit
+                if x >= width:
+                    break
+                if b & (0x80 >> bit):
+                    continue
+                nx = x
+                ny = y
+                if angle == 90:
+                    nx = height - 1 - y
+                    ny = x
+                elif angle == 180:
+                    nx = width - 1 - x
+                    ny = height - 1 - y
+                elif angle == 270:
+                    nx = y
+                    ny = width - 1 - x
+                i = ny * dst_bw + (nx >> 3)
+                dst[i] = dst[i] & (0xFF ^ (0x80 >> (nx & 7)))
 
 class DisplayManager:
-    def __init__(self):
-        self.spi = SPI(0, baudrate=1_000_000, polarity=0, phase=0, sck=Pin(18), mosi=Pin(19), miso=Pin(20))
+    def __init__(self, glyph_cache_bytes: int = 8192, spi_hz: int = 20_000_000):
+        """
+        :param glyph_cache_bytes: RAM budget for pre-rasterized nice_text glyphs. 0 disables the cache.
+        :param spi_hz: SPI clock for the panel. Lower it if the display shows corrupted frames.
+        """
+        self.spi = SPI(0, baudrate=spi_hz, polarity=0, phase=0, sck=Pin(18), mosi=Pin(19), miso=Pin(20))
 
         self.cs = Pin(24, Pin.OUT)
         self.dc = Pin(25, Pin.OUT)
@@ -28,6 +107,10 @@ class DisplayManager:
         self.display = einkdriver.EPD(self.spi, self.cs, self.dc, self.rst, self.busy)
         self.display.init()
 
+        self.glyph_cache_bytes = glyph_cache_bytes
+        self._glyph_cache = {}
+        self._glyph_cache_used = 0
+
     def _rotate_buffer(self, angle: int):
         """
         Rotate the current frame buffer by the requested angle (clockwise degrees).
@@ -44,22 +127,10 @@ class DisplayManager:
         dst_w = height if angle in (90, 270) else width
         dst_h = width if angle in (90, 270) else height
 
-        src_fb = framebuf.FrameBuffer(self.display.buffer, width, height, framebuf.MONO_HLSB)
         dst_buffer = bytearray(len(self.display.buffer))
-        dst_fb = framebuf.FrameBuffer(dst_buffer, dst_w, dst_h, framebuf.MONO_HLSB)
-
-        for y in range(height):
-            for x in range(width):
-                color = src_fb.pixel(x, y)
-                if angle == 90:
-                    nx, ny = height - 1 - y, x
-                elif angle == 180:
-                    nx, ny = width - 1 - x, height - 1 - y
-                elif angle == 270:
-                    nx, ny = y, width - 1 - x
-                else:
-                    nx, ny = x, y
-                dst_fb.pixel(nx, ny, color)
+        # Start from white; the viper copy only clears the black pixels
+        framebuf.FrameBuffer(dst_buffer, dst_w, dst_h, framebuf.MONO_HLSB).fill(1)
+        _rotate_hlsb(self.display.buffer, dst_buffer, width, height, angle)
 
         return dst_buffer
 
@@ -105,13 +176,73 @@ class DisplayManager:
         :param x_spacing: Horizontal spacing between characters.
         :param y_spacing: Vertical spacing between lines.
         """
+        font = self._resolve_font(font)
+        
+        if rot == 0:
+            # Unrotated text is blitted from cached glyph bitmaps instead of drawn pixel by pixel
+            fb = self.display.framebuf
+            key = color ^ 1
+            off_x = 0
+            off_y = 0
+            for c in text:
+                if c == '\n':
+                    off_y += font.height + y_spacing
+                    off_x = 0
+                    continue
+                glyph, width = self._glyph(font, c, color)
+                fb.blit(glyph, x + off_x, y + off_y, key)
+                off_x += x_spacing + width
+            return
+
+        font.write(text, self.display.framebuf, framebuf.MONO_HLSB, self.display.width, self.display.height, x, y, color, rot=rot, x_spacing=x_spacing, y_spacing=y_spacing)
+
+    def preheat_font(self, font: Union[int, MicroFont], chars: str, color: int = 0) -> None:
+        """
+        Rasterize a known set of characters ahead of time, so later unrotated nice_text calls
+        using them don't have to read the font file.
+        :param font: Font size or a MicroFont instance.
+        :param chars: The characters to prepare.
+        :param color: Color the text will be drawn in (0=black, 1=white).
+        """
+        font = self._resolve_font(font)
+        for c in chars:
+            if c != '\n':
+                self._glyph(font, c, color)
+
+    def _resolve_font(self, font: Union[int, MicroFont]) -> MicroFont:
         if isinstance(font, int):
             font = nice_fonts.get(font)
         
         if not font:
             raise ValueError(f"Invalid font size. Available built-in sizes: {', '.join(map(str, nice_fonts.keys()))}, or provide a MicroFont instance with your own font.")
-        
-        font.write(text, self.display.framebuf, framebuf.MONO_HLSB, self.display.width, self.display.height, x, y, color, rot=rot, x_spacing=x_spacing, y_spacing=y_spacing)
+        return font
+
+    def _glyph(self, font: MicroFont, char: str, color: int):
+        """
+        Return a (FrameBuffer, advance width) pair for a character, rasterized so that
+        ink pixels are `color` and everything else is `color ^ 1`, for use as a blit key.
+        """
+        cache_key = (font, char, color)
+        glyph = self._glyph_cache.get(cache_key)
+        if glyph:
+            return glyph
+
+        data, height, width = font.get_ch(char)
+        # Font bitmaps set a bit for ink; black text needs ink cleared and background set
+        if color:
+            buf = bytearray(data)
+        else:
+            buf = bytearray(len(data))
+            _invert_bytes(data, buf, len(data))
+        glyph = (framebuf.FrameBuffer(buf, (width + 7) & ~7, height, framebuf.MONO_HLSB), width)
+
+        if len(buf) <= self.glyph_cache_bytes:
+            if self._glyph_cache_used + len(buf) > self.glyph_cache_bytes:
+                self._glyph_cache.clear()
+                self._glyph_cache_used = 0
+            self._glyph_cache[cache_key] = glyph
+            self._glyph_cache_used += len(buf)
+        return glyph
 
     def blit(self, fb, x: int, y: int):
         self.display.blit(fb, x, y)
@@ -126,9 +257,12 @@ class DisplayManager:
             dimensions = f.readline().strip()
             width, height = map(int, dimensions.split())
             # Read the pixel data
-            pixel_data = bytearray(~b & 0xFF for b in f.read()) # the e-ink means the PBM format swaps black and white
-            if len(pixel_data) != (width * height + 7) // 8:
+            data = f.read()
+            expected = (width * height + 7) // 8
+            if len(data) != expected:
                 raise ValueError("Pixel data does not match specified dimensions.")
+            pixel_data = bytearray(expected)
+            _invert_bytes(data, pixel_data, expected) # the e-ink means the PBM format swaps black and white
             # Create a FrameBuffer from the pixel data
             fb = framebuf.FrameBuffer(pixel_data, width, height, framebuf.MONO_HLSB)
         return fb
@@ -7,6 +7,9 @@ import utime
 EPD_WIDTH  = 200
 EPD_HEIGHT = 200
 
+# All-white frame for the default panel size, allocated at import while the heap is still unfragmented
+WHITE_FRAME = b'\xff' * (((EPD_WIDTH + 7) // 8) * EPD_HEIGHT)
+
 # Command constants
 DRIVER_OUTPUT_CONTROL                = 0x01
 BOOSTER_SOFT_START_CONTROL           = 0x0C
@@ -30,53 +33,103 @@ SET_RAM_Y_ADDRESS_COUNTER            = 0x4F
 TERMINATE_FRAME_READ_WRITE           = 0xFF
 
 # Waveform full refresh
-WF_FULL_1IN54 = bytearray([
-    0x80, 0x48, 0x40, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x40, 0x48, 0x80, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x80, 0x48, 0x40, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x40, 0x48, 0x80, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0xA, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x8, 0x1, 0x0, 0x8, 0x1, 0x0, 0x2,
-    0xA, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x0, 0x0, 0x0,
-    0x22, 0x17, 0x41, 0x0, 0x32, 0x20
-])
+WF_FULL_1IN54 = (
+    b'\x80\x48\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x40\x48\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x80\x48\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x40\x48\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x0A\x00\x00\x00\x00\x00\x00'
+    b'\x08\x01\x00\x08\x01\x00\x02'
+    b'\x0A\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x22\x22\x22\x22\x22\x22\x00\x00\x00'
+    b'\x22\x17\x41\x00\x32\x20'
+)
 
 # Waveform partial refresh (fast)
-WF_PARTIAL_1IN54_0 = bytearray([
-    0x0, 0x40, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x80, 0x80, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x40, 0x40, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x80, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0xF, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x1, 0x1, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
-    0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x0, 0x0, 0x0,
-    0x02, 0x17, 0x41, 0xB0, 0x32, 0x28,
-])
+WF_PARTIAL_1IN54_0 = (
+    b'\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x40\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x0F\x00\x00\x00\x00\x00\x00'
+    b'\x01\x01\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00'
+    b'\x22\x22\x22\x22\x22\x22\x00\x00\x00'
+    b'\x02\x17\x41\xB0\x32\x28'
+)
+
+# Display update control 2 options
+UPDATE_FULL    = b'\xC7'  # Option for LUT from register - full refresh
+UPDATE_PARTIAL = b'\xCF'  # Option for LUT from register - partial refresh
+
+# Display option payload (register 0x37) for partial refresh
+DISPLAY_OPTION_PARTIAL = b'\x00\x00\x00\x00\x00\x40\x00\x00\x00\x00'
+
+# Register sequences as (command, data) pairs, built once at import
+INIT_SEQUENCE_H = (
+    (DRIVER_OUTPUT_CONTROL, b'\xC7\x00\x01'),
+    (DATA_ENTRY_MODE_SETTING, b'\x01'),
+    (SET_RAM_X_ADDRESS_START_END_POSITION, b'\x00\x18'),      # 0x18-->(24+1)*8=200
+    (SET_RAM_Y_ADDRESS_START_END_POSITION, b'\xC7\x00\x00\x00'),  # 0xC7-->(199+1)=200
+    (BORDER_WAVEFORM_CONTROL, b'\x01'),
+    (0x18, b'\x80'),
+    (DISPLAY_UPDATE_CONTROL_2, b'\xB1'),                        # Load Temperature and waveform setting
+    (MASTER_ACTIVATION, None),
+    (SET_RAM_X_ADDRESS_COUNTER, b'\x00'),
+    (SET_RAM_Y_ADDRESS_COUNTER, b'\xC7\x00'),
+)
+
+INIT_SEQUENCE_V = (
+    (DRIVER_OUTPUT_CONTROL, b'\xC7\x00\x00'),
+    (DATA_ENTRY_MODE_SETTING, b'\x03'),
+    (SET_RAM_X_ADDRESS_START_END_POSITION, b'\x00\x18'),
+    (SET_RAM_Y_ADDRESS_START_END_POSITION, b'\x00\x00\xC7\x00'),
+) + INIT_SEQUENCE_H[4:]
+
+PARTIAL_MODE_SEQUENCE = (
+    (0x37, DISPLAY_OPTION_PARTIAL),
+    (BORDER_WAVEFORM_CONTROL, b'\x80'),
+    (DISPLAY_UPDATE_CONTROL_2, b'\xC0'),
+    (MASTER_ACTIVATION, None),
+)
+
+FULL_MODE_SEQUENCE = (
+    (BORDER_WAVEFORM_CONTROL, b'\x80'),
+    (DISPLAY_UPDATE_CONTROL_2, UPDATE_FULL),
+    (MASTER_ACTIVATION, None),
+)
+
+@micropython.viper
+def _fill32(buf: ptr32, words: int, value: int):
+    """Fill the first `words` 32-bit words of buf with value"""
+    for i in range(words):
+        buf[i] = value
 
 class EPD:
-    def __init__(self, spi, cs, dc, rst, busy, width=EPD_WIDTH, height=EPD_HEIGHT):
+    # All-white frames used by clear(), keyed by buffer size and shared between instances
+    _white_buf_cache = {len(WHITE_FRAME): WHITE_FRAME}
+
+    def __init__(self, spi, cs, dc, rst, busy, width=EPD_WIDTH, height=EPD_HEIGHT, buffer=None):
         """
         Initialize E-Paper display
         
@@ -88,6 +141,8 @@ class EPD:
             busy: Busy pin
             width: Display width (default 200)
             height: Display height (default 200)
+            buffer: Preallocated frame buffer to draw into (allocated if None).
+                The caller keeps ownership; it must hold exactly one frame.
         """
         self.spi = spi
         self.cs = cs
@@ -104,25 +159,112 @@ class EPD:
         self.busy.init(self.busy.IN)
         
         # Create buffer for frame
-        self.buffer_size = (self.width // 8) * self.height
-        self.buffer = bytearray(self.buffer_size)
+        self.bytes_per_row = (self.width + 7) // 8  # Width in bytes, ceiling division
+        self.buffer_size = self.bytes_per_row * self.height
+        if buffer is None:
+            buffer = bytearray(self.buffer_size)
+        elif len(buffer) != self.buffer_size:
+            raise ValueError("Buffer size does not match display dimensions.")
+        self.buffer = buffer
         self.framebuf = framebuf.FrameBuffer(self.buffer, self.width, self.height, framebuf.MONO_HLSB)
-        
-        # Initialize display (default to horizontal direction)
-        self.init()
+        self._bind_framebuf()
+        # (buffer, FrameBuffer) pairs keyed by id(buffer), so use_buffer() never rebuilds a FrameBuffer
+        self._framebufs = {id(self.buffer): (self.buffer, self.framebuf)}
+        
+        # Immutable all-white frame for clear(), shared with other instances of the same size
+        self._white = EPD._white_buf_cache.get(self.buffer_size)
+        if self._white is None:
+            self._white = EPD._white_buf_cache[self.buffer_size] = b'\xff' * self.buffer_size
+        
+        # Refresh mode the panel is currently set up for: None, 'full' (as left by init()),
+        # 'full_lut' (full LUT after init_full_mode(), RAM addressing at reset defaults) or
+        # 'partial'. The caller runs init() once before drawing.
+        self._mode = None
+        # Orientation passed to the last init(), which decides the RAM addressing
+        self._orientation = 'h'
+        # Set from the busy pin's falling-edge IRQ once wait_until_idle_async() is first used
+        self._idle_flag = None
+        
+        # Scratch byte for single-byte commands and data, reused to avoid an allocation per write
+        self._one = bytearray(1)
+        # Scratch argument bytes for the RAM window and pointer registers, with prebuilt views
+        self._args = bytearray(4)
+        self._args1 = memoryview(self._args)[:1]
+        self._args2 = memoryview(self._args)[:2]
     
+    @micropython.native
     def send_command(self, command):
         """Send command to display"""
+        self._one[0] = command
         self.dc.value(0)
         self.cs.value(0)
-        self.spi.write(bytearray([command]))
+        self.spi.write(self._one)
         self.cs.value(1)
 
+    @micropython.native
     def send_data(self, data):
         """Send data to display"""
+        self._one[0] = data
+        self.dc.value(1)
+        self.cs.value(0)
+        self.spi.write(self._one)
+        self.cs.value(1)
+
+    @micropython.native
+    def send(self, command, data=None):
+        """Send a command and its data bytes to display in a single chip-select frame"""
+        self._one[0] = command
+        self.dc.value(0)
+        self.cs.value(0)
+        self.spi.write(self._one)
+        if data is not None:
+            self.dc.value(1)
+            self.spi.write(data)
+        self.cs.value(1)
+
+    def send_sequence(self, sequence):
+        """Send a sequence of (command, data) register writes"""
+        for command, data in sequence:
+            self.send(command, data)
+
+    @micropython.native
+    def write_ram(self, buf, start=0, length=None):
+        """Send WRITE_RAM followed by a buffer of pixel data in a single chip-select frame"""
+        self._one[0] = WRITE_RAM
+        self.dc.value(0)
+        self.cs.value(0)
+        self.spi.write(self._one)
         self.dc.value(1)
+        self.spi.write(buf if length is None else memoryview(buf)[start:start + length])
+        self.cs.value(1)
+    
+    @micropython.native
+    def write_ram_rows(self, buf, start, stride, row_bytes, rows):
+        """
+        Send WRITE_RAM followed by a rectangular region of a buffer in a single chip-select frame
+        
+        Args:
+            buf: Source buffer
+            start: Offset of the first byte of the region
+            stride: Bytes per row in buf
+            row_bytes: Bytes per row of the region
+            rows: Number of rows
+        """
+        view = memoryview(buf)
+        self._one[0] = WRITE_RAM
+        self.dc.value(0)
         self.cs.value(0)
-        self.spi.write(bytearray([data]))
+        self.spi.write(self._one)
+        self.dc.value(1)
+        if row_bytes == stride:
+            # Rows are contiguous, so the whole region is one slice
+            self.spi.write(view[start:start + stride * rows])
+        else:
+            end = start + row_bytes
+            for _ in range(rows):
+                self.spi.write(view[start:end])
+                start += stride
+                end += stride
         self.cs.value(1)
     
     def reset(self):
@@ -134,36 +276,53 @@ class EPD:
         self.rst.value(1)
         utime.sleep_ms(20)
     
-    def wait_until_idle(self):
-        """Wait until the busy pin goes HIGH"""
+    def wait_until_idle(self, settle_ms=0):
+        """
+        Wait until the busy pin goes LOW
+        
+        Args:
+            settle_ms: Extra delay after the panel reports idle
+        """
+        # Back off from 1 ms up to 20 ms so short operations return promptly
+        delay = 1
         while self.busy.value() == 1:      # LOW: idle, HIGH: busy
-            utime.sleep_ms(100)
-        utime.sleep_ms(200)
+            utime.sleep_ms(delay)
+            if delay < 20:
+                delay <<= 1
+        if settle_ms:
+            utime.sleep_ms(settle_ms)
+    
+    async def wait_until_idle_async(self, settle_ms=0):
+        """Wait until the busy pin goes LOW, letting other tasks run meanwhile"""
+        # Imported here so synchronous users of the driver never load asyncio; after the
+        # first call this is just a lookup in sys.modules
+        try:
+            import asyncio
+        except ImportError:
+            import uasyncio as asyncio
+        if self._idle_flag is None:
+            self._idle_flag = asyncio.ThreadSafeFlag()
+            self.busy.irq(trigger=self.busy.IRQ_FALLING, handler=lambda pin: self._idle_flag.set())
+        # The flag may be left over from an earlier edge, so re-check the pin each time it fires
+        while self.busy.value() == 1:      # LOW: idle, HIGH: busy
+            await self._idle_flag.wait()
+        if settle_ms:
+            await asyncio.sleep_ms(settle_ms)
     
     def lut(self, lut_array):
         """Send lookup table to display"""
-        self.send_command(WRITE_LUT_REGISTER)
-        for i in range(153):
-            self.send_data(lut_array[i])
+        self.send(WRITE_LUT_REGISTER, memoryview(lut_array)[:153])
         self.wait_until_idle()
     
     def set_lut(self, lut_array):
         """Set lookup table and related registers"""
         self.lut(lut_array)
         
-        self.send_command(0x3f)
-        self.send_data(lut_array[153])
-        
-        self.send_command(0x03)
-        self.send_data(lut_array[154])
-        
-        self.send_command(0x04)
-        self.send_data(lut_array[155])
-        self.send_data(lut_array[156])
-        self.send_data(lut_array[157])
-        
-        self.send_command(0x2c)
-        self.send_data(lut_array[158])
+        lut_view = memoryview(lut_array)
+        self.send(0x3f, lut_view[153:154])
+        self.send(0x03, lut_view[154:155])
+        self.send(0x04, lut_view[155:158])
+        self.send(0x2c, lut_view[158:159])
     
     def init(self, orientation='h'):
         """
@@ -174,75 +333,21 @@ class EPD:
         """
         self.reset()
         
-        self.wait_until_idle()
         self.send_command(SW_RESET)  # SWRESET
         self.wait_until_idle()
         
-        self.send_command(DRIVER_OUTPUT_CONTROL)  # Driver output control
-        self.send_data(0xC7)
-        self.send_data(0x00)
-        if orientation == 'h':  # Horizontal
-            self.send_data(0x01)
-            
-            self.send_command(DATA_ENTRY_MODE_SETTING)  # Data entry mode
-            self.send_data(0x01)
-            
-            self.send_command(SET_RAM_X_ADDRESS_START_END_POSITION)  # Set Ram-X address start/end position
-            self.send_data(0x00)
-            self.send_data(0x18)  # 0x0C-->(18+1)*8=200
-            
-            self.send_command(SET_RAM_Y_ADDRESS_START_END_POSITION)  # Set Ram-Y address start/end position
-            self.send_data(0xC7)  # 0xC7-->(199+1)=200
-            self.send_data(0x00)
-            self.send_data(0x00)
-            self.send_data(0x00)
-        else:  # Vertical (Low direction)
-            self.send_data(0x00)
-            
-            self.send_command(DATA_ENTRY_MODE_SETTING)  # Data entry mode
-            self.send_data(0x03)
-            
-            self.send_command(SET_RAM_X_ADDRESS_START_END_POSITION)
-            self.send_data((0 >> 3) & 0xFF)
-            self.send_data((199 >> 3) & 0xFF)
-            
-            self.send_command(SET_RAM_Y_ADDRESS_START_END_POSITION)
-            self.send_data(0 & 0xFF)
-            self.send_data((0 >> 8) & 0xFF)
-            self.send_data(199 & 0xFF)
-            self.send_data((199 >> 8) & 0xFF)
-        
-        self.send_command(BORDER_WAVEFORM_CONTROL)  # BorderWaveform
-        self.send_data(0x01)
-        
-        self.send_command(0x18)
-        self.send_data(0x80)
-        
-        self.send_command(DISPLAY_UPDATE_CONTROL_2)  # Load Temperature and waveform setting
-        self.send_data(0xB1)
-        self.send_command(MASTER_ACTIVATION)
-        
-        self.send_command(SET_RAM_X_ADDRESS_COUNTER)  # Set RAM x address count
-        self.send_data(0x00)
-        
-        self.send_command(SET_RAM_Y_ADDRESS_COUNTER)  # Set RAM y address count
-        self.send_data(0xC7)
-        self.send_data(0x00)
+        self.send_sequence(INIT_SEQUENCE_H if orientation == 'h' else INIT_SEQUENCE_V)
+        self._orientation = orientation
         
         self.wait_until_idle()
         
         # Set LUT
         self.set_lut(WF_FULL_1IN54)
+        self._mode = 'full'
     
     def clear(self):
         """Clear the display with white"""
-        w = (self.width + 7) // 8  # Width in bytes, ceiling division
-        h = self.height
-        
-        self.send_command(WRITE_RAM)
-        for j in range(h):
-            for i in range(w):
-                self.send_data(0xFF)  # White
+        self._write_frame(self._white)
         
         # Display refresh
         self.display_frame()
@@ -251,27 +356,53 @@ class EPD:
         """
         Display a frame buffer
         
+        The panel is only re-initialized when it is not already in full refresh
+        mode (first use, after partial updates or after sleep()); call init()
+        yourself to force a clean state.
+        
         Args:
             buffer: Buffer to display (uses internal buffer if None)
         """
-        #self.reset()
-        #self.init_full_mode()
-        self.init()
+        self._write_frame(buffer)
         
-        if buffer is None:
-            buffer = self.buffer
+        # Display refresh
+        self.display_frame()
+
+    async def display_async(self, buffer=None):
+        """
+        Display a frame buffer, letting other tasks run while the panel refreshes
         
-        w = (self.width + 7) // 8  # Width in bytes, ceiling division
-        h = self.height
+        Args:
+            buffer: Buffer to display (uses internal buffer if None)
+        """
+        self._write_frame(buffer)
         
-        self.send_command(WRITE_RAM)  # Write to RAM area 0x24
-        for j in range(h):
-            for i in range(w):
-                self.send_data(buffer[i + j * w])
+        # Display refresh
+        await self.display_frame_async()
+
+    def _write_frame(self, buffer):
+        """Upload a full frame to display RAM, re-initializing if needed"""
+        if buffer is None:
+            buffer = self.buffer
+        elif len(buffer) < self.buffer_size:
+            raise ValueError("Buffer is smaller than one frame.")
         
+        # Only re-initialize when the panel is not in the state init() leaves it in
+        if self._mode != 'full':
+            self.init(self._orientation)
+        else:
+            self._set_full_window()
         
-        # Display refresh
-        self.display_frame()
+        self.write_ram(buffer, 0, self.buffer_size)
+
+    def _set_full_window(self):
+        """Restore the full-frame RAM window and address counter that init() sets up"""
+        if self._orientation == 'h':
+            # Y counts down from the last row
+            self.set_memory_area(0, self.height - 1, self.width - 1, 0)
+        else:
+            self.set_memory_area(0, 0, self.width - 1, self.height - 1)
+        self.set_memory_pointer(0, self.height - 1)
 
     def display_base_image(self, buffer=None):
         """
@@ -281,20 +412,9 @@ class EPD:
         Args:
             buffer: Buffer to display (uses internal buffer if None)
         """
-        # Reset display to clear any partial display settings
-        self.reset()
-        self.init_full_mode()
-        
-        if buffer is None:
-            buffer = self.buffer
-            
-        w = (self.width + 7) // 8  # Width in bytes, ceiling division
-        h = self.height
-        
-        self.send_command(WRITE_RAM)  # Write to RAM area 0x24
-        for j in range(h):
-            for i in range(w):
-                self.send_data(buffer[i + j * w])
+        # Re-initialize to clear any partial display settings, so the frame lands with the
+        # same RAM addressing as display()
+        self._write_frame(buffer)
         
         # Display refresh with full update
         self.display_frame()
@@ -327,25 +447,17 @@ class EPD:
         x_end = min(x + w - 1, self.width - 1)
         y_end = min(y + h - 1, self.height - 1)
         
-        # Initialize partial refresh mode
-        self.init_partial_mode()
+        # The partial LUT and display options persist until reset or sleep
+        if self._mode != 'partial':
+            self.init_partial_mode()
         
         # Set the area to update
         self.set_memory_area(x, y, x_end, y_end)
         self.set_memory_pointer(x, y)
         
-        # Calculate buffer offsets and sizes
-        bytes_per_line = (w + 7) // 8
-        buffer_width = (self.width + 7) // 8
-        
-        # Send data for the specified region
-        self.send_command(WRITE_RAM)
-        for j in range(y, y_end + 1):
-            for i in range(x // 8, (x_end // 8) + 1):
-                # Get the data from the buffer
-                # Adjust index based on full buffer width
-                index = i + j * buffer_width
-                self.send_data(buffer[index])
+        # Send data for the specified region, adjusting the index based on full buffer width
+        self.write_ram_rows(buffer, y * self.bytes_per_row + x // 8, self.bytes_per_row,
+                            (x_end // 8) - (x // 8) + 1, y_end - y + 1)
         
         # Partial display refresh
         self.display_partial_frame()
@@ -359,25 +471,9 @@ class EPD:
         self.set_lut(WF_PARTIAL_1IN54_0)
         
         # Additional settings for partial refresh
-        self.send_command(0x37)
-        self.send_data(0x00)
-        self.send_data(0x00)
-        self.send_data(0x00)
-        self.send_data(0x00)
-        self.send_data(0x00)
-        self.send_data(0x40)
-        self.send_data(0x00)
-        self.send_data(0x00)
-        self.send_data(0x00)
-        self.send_data(0x00)
-        
-        self.send_command(0x3C)
-        self.send_data(0x80)
-        
-        self.send_command(DISPLAY_UPDATE_CONTROL_2)
-        self.send_data(0xC0)
-        self.send_command(MASTER_ACTIVATION)
+        self.send_sequence(PARTIAL_MODE_SEQUENCE)
         self.wait_until_idle()
+        self._mode = 'partial'
     
     def init_full_mode(self):
         """Initialize the display for full refresh mode"""
@@ -387,13 +483,10 @@ class EPD:
         # Set LUT for full update
         self.set_lut(WF_FULL_1IN54)
         
-        self.send_command(0x3C)
-        self.send_data(0x80)
-        
-        self.send_command(DISPLAY_UPDATE_CONTROL_2)
-        self.send_data(0xC7)  # Option for LUT from register - full refresh
-        self.send_command(MASTER_ACTIVATION)
+        self.send_sequence(FULL_MODE_SEQUENCE)
         self.wait_until_idle()
+        # The reset dropped init()'s RAM addressing, so this is not the 'full' state
+        self._mode = 'full_lut'
     
     def set_memory_area(self, x_start, y_start, x_end, y_end):
         """
@@ -405,16 +498,16 @@ class EPD:
             x_end: X end position
             y_end: Y end position
         """
-        self.send_command(SET_RAM_X_ADDRESS_START_END_POSITION)
+        args = self._args
         # x point must be the multiple of 8 or the last 3 bits will be ignored
-        self.send_data((x_start >> 3) & 0xFF)
-        self.send_data((x_end >> 3) & 0xFF)
-        
-        self.send_command(SET_RAM_Y_ADDRESS_START_END_POSITION)
-        self.send_data(y_start & 0xFF)
-        self.send_data((y_start >> 8) & 0xFF)
-        self.send_data(y_end & 0xFF)
-        self.send_data((y_end >> 8) & 0xFF)
+        args[0] = (x_start >> 3) & 0xFF
+        args[1] = (x_end >> 3) & 0xFF
+        self.send(SET_RAM_X_ADDRESS_START_END_POSITION, self._args2)
+        args[0] = y_start & 0xFF
+        args[1] = (y_start >> 8) & 0xFF
+        args[2] = y_end & 0xFF
+        args[3] = (y_end >> 8) & 0xFF
+        self.send(SET_RAM_Y_ADDRESS_START_END_POSITION, args)
     
     def set_memory_pointer(self, x, y):
         """
@@ -424,31 +517,37 @@ class EPD:
             x: X position
             y: Y position
         """
-        self.send_command(SET_RAM_X_ADDRESS_COUNTER)
+        args = self._args
         # x point must be the multiple of 8 or the last 3 bits will be ignored
-        self.send_data((x >> 3) & 0xFF)
-        
-        self.send_command(SET_RAM_Y_ADDRESS_COUNTER)
-        self.send_data(y & 0xFF)
-        self.send_data((y >> 8) & 0xFF)
+        args[0] = (x >> 3) & 0xFF
+        self.send(SET_RAM_X_ADDRESS_COUNTER, self._args1)
+        args[0] = y & 0xFF
+        args[1] = (y >> 8) & 0xFF
+        self.send(SET_RAM_Y_ADDRESS_COUNTER, self._args2)
         
         self.wait_until_idle()
     
+    def activate(self, option):
+        """Start a display update with the given DISPLAY_UPDATE_CONTROL_2 option"""
+        self.send(DISPLAY_UPDATE_CONTROL_2, option)
+        self.send_command(MASTER_ACTIVATION)
+    
     def display_frame(self):
         """Update the display (full refresh)"""
-        self.send_command(DISPLAY_UPDATE_CONTROL_2)
-        self.send_data(0xC7)
-        self.send_command(MASTER_ACTIVATION)
-        self.wait_until_idle()
+        self.activate(UPDATE_FULL)
+        self.wait_until_idle(settle_ms=20)
+
+    async def display_frame_async(self):
+        """Update the display (full refresh), letting other tasks run until it finishes"""
+        self.activate(UPDATE_FULL)
+        await self.wait_until_idle_async(settle_ms=20)
     
     def display_partial_frame(self):
         """
         Update the display using partial refresh mode
         This is faster but may cause some ghosting over time
         """
-        self.send_command(DISPLAY_UPDATE_CONTROL_2)
-        self.send_data(0xCF)  # Option for LUT from register - partial refresh
-        self.send_command(MASTER_ACTIVATION)
+        self.activate(UPDATE_PARTIAL)
         self.wait_until_idle()
     
     def set_frame_memory(self, image_buffer, x, y, image_width, image_height):
@@ -472,9 +571,9 @@ class EPD:
         utime.sleep_ms(2)
         self.rst.value(1)
         utime.sleep_ms(2)
+        self._mode = None  # The reset dropped the LUT and mode registers
         
-        self.send_command(0x3C)
-        self.send_data(0x80)
+        self.send(BORDER_WAVEFORM_CONTROL, b'\x80')
         
         # x point must be the multiple of 8 or the last 3 bits will be ignored
         x &= 0xF8
@@ -493,11 +592,8 @@ class EPD:
         self.set_memory_area(x, y, x_end, y_end)
         self.set_memory_pointer(x, y)
         
-        self.send_command(WRITE_RAM)
         # Send the image data
-        for j in range(y_end - y + 1):
-            for i in range((x_end - x + 1) // 8):
-                self.send_data(image_buffer[i + j * (image_width // 8)])
+        self.write_ram_rows(image_buffer, 0, image_width // 8, (x_end - x + 1) // 8, y_end - y + 1)
     
     def set_frame_memory_partial(self, image_buffer, x, y, image_width, image_height):
         """
@@ -516,8 +612,9 @@ class EPD:
                 y < 0 or image_height < 0):
             return
             
-        # Initialize partial refresh mode
-        self.init_partial_mode()
+        # The partial LUT and display options persist until reset or sleep
+        if self._mode != 'partial':
+            self.init_partial_mode()
         
         # x point must be the multiple of 8 or the last 3 bits will be ignored
         x &= 0xF8
@@ -536,55 +633,56 @@ class EPD:
         self.set_memory_area(x, y, x_end, y_end)
         self.set_memory_pointer(x, y)
         
-        self.send_command(WRITE_RAM)
         # Send the image data
-        bytes_per_line = image_width // 8
-        for j in range(y_end - y + 1):
-            for i in range((x_end - x + 1) // 8):
-                self.send_data(image_buffer[i + j * bytes_per_line])
+        self.write_ram_rows(image_buffer, 0, image_width // 8, (x_end - x + 1) // 8, y_end - y + 1)
     
     def sleep(self):
         """Put display into deep sleep mode to save power"""
-        self.send_command(DEEP_SLEEP_MODE)
-        self.send_data(0x01)
+        self.send(DEEP_SLEEP_MODE, b'\x01')
         utime.sleep_ms(200)
         
         # Pull reset pin low to ensure sleep mode
         self.rst.value(0)
+        self._mode = None
     
     # Framebuffer methods for easy drawing
     def fill(self, color):
         """Fill the entire buffer with a color (0=black, 1=white)"""
-        self.framebuf.fill(color)
-    
-    def pixel(self, x, y, color):
-        """Set a pixel color (0=black, 1=white)"""
-        self.framebuf.pixel(x, y, color)
-    
-    def hline(self, x, y, w, color):
-        """Draw a horizontal line"""
-        self.framebuf.hline(x, y, w, color)
-    
-    def vline(self, x, y, h, color):
-        """Draw a vertical line"""
-        self.framebuf.vline(x, y, h, color)
-    
-    def line(self, x1, y1, x2, y2, color):
-        """Draw a line"""
-        self.framebuf.line(x1, y1, x2, y2, color)
-    
-    def rect(self, x, y, w, h, color):
-        """Draw a rectangle"""
-        self.framebuf.rect(x, y, w, h, color)
-    
-    def fill_rect(self, x, y, w, h, color):
-        """Draw a filled rectangle"""
-        self.framebuf.fill_rect(x, y, w, h, color)
+        # Solid fills are plain word stores; skip the per-byte framebuf path. Only a bytearray's
+        # storage is known to be word-aligned: a caller's memoryview may start at any offset, and
+        # an unaligned word store faults on the Cortex-M0+
+        if (color == 0 or color == 1) and not self.buffer_size & 3 and type(self.buffer) is bytearray:
+            _fill32(self.buffer, self.buffer_size >> 2, -color)
+        else:
+            self.framebuf.fill(color)
     
     def text(self, text, x, y, color=0):
         """Draw text"""
         self.framebuf.text(text, x, y, color)
     
-    def blit(self, src, x, y):
-        """Blit a source buffer onto the display at (x, y)"""
-        self.framebuf.blit(src, x, y)
\ No newline at end of file
+    def use_buffer(self, buf):
+        """
+        Switch drawing and display() to another frame buffer, e.g. to draw the
+        next frame while the previous one is still refreshing
+        
+        Args:
+            buf: Caller-allocated buffer holding exactly one frame
+        """
+        entry = self._framebufs.get(id(buf))
+        if entry is None or entry[0] is not buf:
+            if len(buf) != self.buffer_size:
+                raise ValueError("Buffer size does not match display dimensions.")
+            entry = self._framebufs[id(buf)] = (buf, framebuf.FrameBuffer(buf, self.width, self.height, framebuf.MONO_HLSB))
+        self.buffer, self.framebuf = entry
+        self._bind_framebuf()
+    
+    def _bind_framebuf(self):
+        """Expose the FrameBuffer's drawing methods directly, without a wrapper call per primitive"""
+        fb = self.framebuf
+        self.pixel = fb.pixel
+        self.hline = fb.hline
+        self.vline = fb.vline
+        self.line = fb.line
+        self.rect = fb.rect
+        self.fill_rect = fb.fill_rect
+        self.blit = fb.blit
\ No newline at end of file
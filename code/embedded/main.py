@@ -1,6 +1,11 @@
 from machine import Pin, SPI, PWM, ADC, unique_id
 import time
 import json
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+from array import array
 from display import DisplayManager, nice_fonts
 
 display = DisplayManager()
@@ -12,48 +17,101 @@ photodiode = ADC(Pin(28))
 # Button on GPIO 13 with internal pull-up (active low)
 button = Pin(13, Pin.IN, Pin.PULL_UP)
 
+# Print decode diagnostics; const so the compiler drops the disabled branches
+DEBUG = const(False)
+
 # Timing parameters (must match web flasher settings)
 BIT_HOLD_MS = 120
 BIT_GAP_MS = 50
 SAMPLE_INTERVAL_MS = 10  # How often to sample the ADC
-
-def crc8(data: bytes, poly: int = 0x07, init: int = 0x00) -> int:
-    """Calculate CRC-8 checksum matching the web flasher."""
-    crc = init & 0xFF
-    for b in data:
-        crc ^= b & 0xFF
+# Longest transmission buffered, enough for a 128-byte config (2 bytes per sample)
+MAX_SAMPLES = 128 * 8 * (BIT_HOLD_MS + BIT_GAP_MS) // SAMPLE_INTERVAL_MS
+# Capture buffer (~34 KB), allocated on the first read rather than at import and reused after that
+_samples = None
+
+def _crc8_table(poly: int) -> bytes:
+    """Build the byte-at-a-time lookup table for a CRC-8 polynomial."""
+    table = bytearray(256)
+    for i in range(256):
+        crc = i
         for _ in range(8):
             if crc & 0x80:
                 crc = ((crc << 1) ^ poly) & 0xFF
             else:
                 crc = (crc << 1) & 0xFF
-    return crc & 0xFF
+        table[i] = crc
+    return bytes(table)
+
+# Table for the web flasher's polynomial, built once at import
+_CRC8_TABLE = _crc8_table(0x07)
+
+@micropython.viper
+def _crc8_update(crc: int, data: ptr8, n: int, table: ptr8) -> int:
+    """Run the first n bytes of data through a CRC-8 lookup table."""
+    for i in range(n):
+        crc = table[crc ^ data[i]]
+    return crc
+
+def crc8(data: bytes, poly: int = 0x07, init: int = 0x00) -> int:
+    """Calculate CRC-8 checksum matching the web flasher."""
+    table = _CRC8_TABLE if poly == 0x07 else _crc8_table(poly)
+    return _crc8_update(init & 0xFF, data, len(data), table)
+
+@micropython.viper
+def _classify(samples: ptr16, levels: ptr8, n: int, low: int, high: int):
+    """Classify n samples into levels: 0=dark (<= low), 2=neutral, 1=bright (>= high)."""
+    for i in range(n):
+        s = samples[i]
+        if s >= high:
+            levels[i] = 1
+        elif s > low:
+            levels[i] = 2
+        else:
+            levels[i] = 0
 
 def read_photodiode_config():
     """Read encoded config data from photodiode while button is held."""
     print("Button pressed - starting photodiode read...")
     
-    samples = []
-    threshold = None
-    bits = []
+    global _samples
+    if _samples is None:
+        # Repeat a one-element array instead of converting a temporary zeroed bytes object
+        _samples = array('H', [0]) * MAX_SAMPLES
+    samples = _samples
+    n = 0
     
-    # Collect samples while button is held
-    while button.value() == 0:  # Button is active low
-        val = photodiode.read_u16()
-        samples.append(val)
-        time.sleep_ms(SAMPLE_INTERVAL_MS)
+    # Bind the hot-loop calls to locals so each sample skips the attribute lookups
+    pressed = button.value
+    read_u16 = photodiode.read_u16
+    sleep_ms = time.sleep_ms
     
-    if len(samples) < 50:
-        print(f"Not enough samples collected: {len(samples)}")
+    # Collect samples while button is held, stopping early once the buffer is full
+    while pressed() == 0:  # Button is active low
+        samples[n] = read_u16()
+        n += 1
+        if n >= MAX_SAMPLES:
+            print("Sample buffer full - decoding what was received")
+            break
+        sleep_ms(SAMPLE_INTERVAL_MS)
+    
+    if n < 50:
+        print(f"Not enough samples collected: {n}")
         return None
     
-    print(f"Collected {len(samples)} samples")
+    if DEBUG:
+        print(f"Collected {n} samples")
+    samples = memoryview(samples)[:n]
     
-    # Calculate threshold (midpoint between min and max)
-    min_val = min(samples)
-    max_val = max(samples)
-    threshold = (min_val + max_val) // 2
-    print(f"Min: {min_val}, Max: {max_val}, Threshold: {threshold}")
+    # Find min and max in a single pass
+    min_val = max_val = samples[0]
+    for s in samples:
+        if s < min_val:
+            min_val = s
+        elif s > max_val:
+            max_val = s
+    if DEBUG:
+        threshold = (min_val + max_val) // 2
+        print(f"Min: {min_val}, Max: {max_val}, Threshold: {threshold}")
     
     if max_val - min_val < 1000:
         print("Signal too weak - not enough contrast between light levels")
@@ -63,71 +121,82 @@ def read_photodiode_config():
     span = max_val - min_val
     high_thresh = min_val + int(span * 0.70)
     low_thresh = min_val + int(span * 0.30)
-    levels = []
-    for s in samples:
-        if s >= high_thresh:
-            levels.append(1)
-        elif s <= low_thresh:
-            levels.append(0)
-        else:
-            levels.append(2)
+    levels = bytearray(n)
+    _classify(samples, levels, n, low_thresh, high_thresh)
 
     # Compute samples counts for hold and gap explicitly
     samples_per_hold = max(1, BIT_HOLD_MS // SAMPLE_INTERVAL_MS)
     samples_per_gap = max(0, BIT_GAP_MS // SAMPLE_INTERVAL_MS)
 
-    bits = []
+    # Decoded bits are packed straight into data (MSB first, matching web flasher); every
+    # accepted bit advances at least one hold+gap period, which bounds how many there can be
+    data = bytearray(n // (samples_per_hold + samples_per_gap) // 8 + 1)
+    bit_count = 0
+    # Sample counts per level (dark, bright, neutral) in the hold window starting at i and
+    # in the gap window after it, updated incrementally as the windows slide
+    hold = [0, 0, 0]
+    gap = [0, 0, 0]
+    recount = True
     i = 0
     # Search for aligned hold+gap windows and decode majority hold value
-    while i + samples_per_hold <= len(levels):
-        hold_window = levels[i:i + samples_per_hold]
+    while i + samples_per_hold <= n:
+        gap_start = i + samples_per_hold
+        if recount:
+            hold[0] = hold[1] = hold[2] = 0
+            gap[0] = gap[1] = gap[2] = 0
+            for k in range(i, gap_start):
+                hold[levels[k]] += 1
+            for k in range(gap_start, min(gap_start + samples_per_gap, n)):
+                gap[levels[k]] += 1
+            recount = False
         # Determine majority in hold window ignoring neutrals where possible
-        ones = hold_window.count(1)
-        zeros = hold_window.count(0)
-        neutrals = hold_window.count(2)
+        ones = hold[1]
+        zeros = hold[0]
         if ones + zeros == 0:
             # No clear hold value here, move forward
-            i += 1
-            continue
-        bit_val = 1 if ones > zeros else 0
-
-        # If there's a gap configured, verify the gap is present (prefer neutral)
-        gap_ok = True
-        if samples_per_gap > 0 and i + samples_per_hold + samples_per_gap <= len(levels):
-            gap_window = levels[i + samples_per_hold: i + samples_per_hold + samples_per_gap]
-            gap_neutrals = gap_window.count(2)
-            # Accept gap if majority of gap samples are neutral or different from hold bit
-            if gap_neutrals * 2 >= len(gap_window):
-                gap_ok = True
-            else:
-                # If gap not neutral, ensure it's not the same as hold (otherwise likely misaligned)
-                if gap_window.count(bit_val) > len(gap_window) // 2:
-                    gap_ok = False
+            gap_ok = False
+        else:
+            bit_val = 1 if ones > zeros else 0
+
+            # If there's a gap configured, verify the gap is present (prefer neutral)
+            gap_ok = True
+            if samples_per_gap > 0 and gap_start + samples_per_gap <= n:
+                # Accept gap if majority of gap samples are neutral or different from hold bit
+                if gap[2] * 2 < samples_per_gap:
+                    # If gap not neutral, ensure it's not the same as hold (otherwise likely misaligned)
+                    if gap[bit_val] > samples_per_gap // 2:
+                        gap_ok = False
         # If gap_ok, accept this bit and advance by hold+gap; else shift by one sample and retry
         if gap_ok:
-            bits.append(bit_val)
-            i += samples_per_hold + samples_per_gap
+            if bit_val:
+                data[bit_count >> 3] |= 0x80 >> (bit_count & 7)
+            bit_count += 1
+            i = gap_start + samples_per_gap
+            recount = True
         else:
+            # Slide both windows one sample: the first gap sample moves into the hold window
+            hold[levels[i]] -= 1
+            if gap_start < n:
+                level = levels[gap_start]
+                hold[level] += 1
+                if samples_per_gap > 0:
+                    gap[level] -= 1
+                    if gap_start + samples_per_gap < n:
+                        gap[levels[gap_start + samples_per_gap]] += 1
             i += 1
     
-    print(f"Decoded {len(bits)} bits: {''.join(str(b) for b in bits[:64])}...")
+    if DEBUG:
+        print(f"Decoded {bit_count} bits: {''.join('{:08b}'.format(b) for b in data[:8])[:bit_count]}...")
     
-    if len(bits) < 8:
+    if bit_count < 8:
         print("Not enough bits decoded")
         return None
     
-    # Convert bits to bytes (MSB first, matching web flasher)
-    byte_count = len(bits) // 8
-    data = bytearray(byte_count)
-    for byte_idx in range(byte_count):
-        byte_val = 0
-        for bit_idx in range(8):
-            bit_pos = byte_idx * 8 + bit_idx
-            if bits[bit_pos]:
-                byte_val |= (1 << (7 - bit_idx))
-        data[byte_idx] = byte_val
+    # Drop the trailing partial byte
+    data = data[:bit_count // 8]
     
-    print(f"Decoded bytes: {data.hex()}")
+    if DEBUG:
+        print(f"Decoded bytes: {data.hex()}")
     
     if len(data) < 2:
         print("Data too short")
@@ -160,12 +229,21 @@ def read_photodiode_config():
             "userHandle": handle,
             "userPronouns": pronouns
         }
-        print(f"Decoded config: {config}")
+        if DEBUG:
+            print(f"Decoded config: {config}")
         return config
     except Exception as e:
         print(f"Failed to parse payload: {e}")
         return None
 
+def load_config():
+    """Load config from config.json, or None if it is missing or unreadable."""
+    try:
+        with open("config.json", "r") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
 def save_config(config: dict):
     """Save config to config.json."""
     try:
@@ -201,37 +279,51 @@ def check_button_and_read():
 # Check for button press at startup
 check_button_and_read()
 
+# Font sizes tried for the name, largest first. Fonts are loaded lazily, so only the sizes
+# actually tried are opened, and each one's characters-per-line is worked out once.
+_NAME_SIZES = sorted((size for size in nice_fonts.keys() if size >= 24), reverse=True)
+_max_chars_cache = {}
+
+def _max_chars(size: int) -> int:
+    max_chars = _max_chars_cache.get(size)
+    if max_chars is None:
+        max_chars = _max_chars_cache[size] = display.display.width // nice_fonts[size].max_width
+    return max_chars
+
 def decide_name_size(name: str, y_space_available: int = 170):
     font = None
-    max_chars_for_sizes = {size: display.display.width // f.max_width for size, f in nice_fonts.items()}
-
-    for size, max_chars in sorted(max_chars_for_sizes.items(), key=lambda x: x[0], reverse=True):
-        if size < 24:
-            continue
-        if len(name) <= max_chars and size <= y_space_available:
+    name_len = len(name)
+
+    # The word splits don't depend on the font size, so work them out once
+    parts = name.split(' ') if ' ' in name else None
+    if parts:
+        mid = len(parts) // 2
+        test_name = ' '.join(parts[:mid]) + '\n' + ' '.join(parts[mid:])
+        test_name_len = max(len(part) for part in test_name.split('\n'))
+        parts_max_len = max(len(part) for part in parts)
+
+    for size in _NAME_SIZES:
+        max_chars = _max_chars(size)
+        if name_len <= max_chars and size <= y_space_available:
             font = nice_fonts[size]
             return font, name
 
-        if ' ' in name:
-            parts = name.split(' ')
-            mid = len(parts) // 2
-            test_name = ' '.join(parts[:mid]) + '\n' + ' '.join(parts[mid:])
-            if max(len(part) for part in test_name.split('\n')) <= max_chars and 2 * size <= y_space_available:
+        if parts:
+            if test_name_len <= max_chars and 2 * size <= y_space_available:
                 font = nice_fonts[size]
                 return font, test_name
 
             lines_available = y_space_available // size
-            if len(parts) <= lines_available and max(len(part) for part in parts) <= max_chars:
+            if len(parts) <= lines_available and parts_max_len <= max_chars:
                 font = nice_fonts[size]
                 return font, '\n'.join(parts)
 
-    for size, max_chars in sorted(max_chars_for_sizes.items(), key=lambda x: x[0], reverse=True):
-        if size < 24:
-            continue
+    for size in _NAME_SIZES:
+        max_chars = _max_chars(size)
         lines_available = max(1, y_space_available // size)
         chunk = max(1, (max_chars - 1))
-        if (len(name) // lines_available) <= chunk:
-            hyph = '-\n'.join(name[i:i + chunk] for i in range(0, len(name), chunk))
+        if (name_len // lines_available) <= chunk:
+            hyph = '-\n'.join(name[i:i + chunk] for i in range(0, name_len, chunk))
             font = nice_fonts[size]
             return font, hyph
 
@@ -247,17 +339,12 @@ badge_data = {
     "slack_handle": None
 }
 
-configured = False
-try:
-    with open("config.json", "r") as f:
-        import json
-        config = json.load(f)
-        badge_data["name"] = config.get("userName")
-        badge_data["pronouns"] = config.get("userPronouns")
-        badge_data["slack_handle"] = config.get("userHandle")
-        configured = True
-except Exception:
-    pass
+config = load_config()
+configured = isinstance(config, dict)
+if configured:
+    badge_data["name"] = config.get("userName")
+    badge_data["pronouns"] = config.get("userPronouns")
+    badge_data["slack_handle"] = config.get("userHandle")
 
 display.fill(1)
 
@@ -269,8 +356,8 @@ if configured:
 
     handle_text = ('@' + badge_data["slack_handle"]) if badge_data.get("slack_handle") and not badge_data["slack_handle"].startswith('@') else badge_data.get("slack_handle", '')
     max_handle_chars = display.display.width // handle_font.max_width if handle_text else 0
-    handle_wrapped = [handle_text[i:i + max_handle_chars] for i in range(0, len(handle_text), max_handle_chars)] if handle_text else []
-    handle_height = len(handle_wrapped) * handle_font.height
+    handle_wrapped = '\n'.join(handle_text[i:i + max_handle_chars] for i in range(0, len(handle_text), max_handle_chars)) if handle_text else ''
+    handle_height = (handle_wrapped.count('\n') + 1) * handle_font.height if handle_wrapped else 0
     pron_height = pron_font.height if badge_data.get("pronouns") else 0
 
     y_space_for_name = 170 - top_margin - pron_height - handle_height - (gap * ((1 if pron_height else 0) + (1 if handle_height else 0)))
@@ -290,7 +377,7 @@ if configured:
 
     if handle_wrapped:
         y = pron_y + (pron_height if pron_height else 0) + gap
-        display.nice_text('\n'.join(handle_wrapped), 10, y, font=handle_font)
+        display.nice_text(handle_wrapped, 10, y, font=handle_font)
 
     display.fill_rect(0, 155, 200, 5, 0)
     display.blit(logo, 0, 170)
@@ -301,8 +388,16 @@ else:
 
 display.show(rotate=-90)
 
-# Main loop - continuously monitor button for photodiode reading
+# Main loop - sleep until the button is pressed, then read the photodiode
+button_pressed = asyncio.ThreadSafeFlag()
+button.irq(trigger=Pin.IRQ_FALLING, handler=lambda pin: button_pressed.set())
+if button.value() == 0:  # Pressed before the IRQ was armed
+    button_pressed.set()
+
+async def wait_for_button():
+    while True:
+        await button_pressed.wait()
+        check_button_and_read()
+
 print("Badge displayed. Hold button (GPIO 13) to read new config from photodiode...")
-while True:
-    check_button_and_read()
-    time.sleep_ms(100)
\ No newline at end of file
+asyncio.run(wait_for_button())
\ No newline at end of file
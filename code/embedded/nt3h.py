@@ -1,25 +1,54 @@
 import time
 
+# NDEF URI identifier codes for the protocol prefixes we abbreviate
+_NDEF_PREFIXES = (
+    ("https://www.", 0x02),
+    ("http://www.", 0x01),
+    ("https://", 0x04),
+    ("http://", 0x03),
+)
+
 class NFCManager():
     def __init__(self, i2c, address=0x55):
         self.i2c = i2c
         self.address = address
+        # Page address + 16 data bytes, reused for every page write
+        self._tx = bytearray(17)
+        # Page address for reads, reused likewise
+        self._rx_page = bytearray(1)
+        # Pick the read transfer the bus supports once, rather than probing on every read
+        if hasattr(i2c, 'writeto_then_readfrom'):
+            self._transfer = self._transfer_combined
+        else:
+            self._transfer = self._transfer_split
 
     def read_page(self, page):
         """
         Reads a single 16-byte page from the NT3H2111/2211.
         """
+        buffer = bytearray(16)
+        if self._read_page_into(page, buffer):
+            return buffer
+        return None
+
+    def _read_page_into(self, page, buffer):
+        """
+        Reads a single 16-byte page into buffer. Returns True on success.
+        """
         try:
-            if hasattr(self.i2c, 'writeto_then_readfrom'):
-                buffer = bytearray(16)
-                self.i2c.writeto_then_readfrom(self.address, bytes([page]), buffer)
-                return buffer
-            else:
-                self.i2c.writeto(self.address, bytes([page]), stop=False)
-                return self.i2c.readfrom(self.address, 16)
+            self._rx_page[0] = page
+            self._transfer(self._rx_page, buffer)
+            return True
         except Exception as e:
             print(f"NFC Read Error on page {page}: {e}")
-            return None
+            return False
+
+    def _transfer_combined(self, out, buffer):
+        self.i2c.writeto_then_readfrom(self.address, out, buffer)
+
+    def _transfer_split(self, out, buffer):
+        self.i2c.writeto(self.address, out, stop=False)
+        self.i2c.readfrom_into(self.address, buffer)
 
     def write_page(self, page, data):
         """
@@ -30,7 +59,10 @@ class NFCManager():
             return False
         
         try:
-            self.i2c.writeto(self.address, bytes([page]) + data)
+            tx = self._tx
+            tx[0] = page
+            tx[1:] = data
+            self.i2c.writeto(self.address, tx)
             # Datasheet specifies a write time (T_write) of max 5ms
             time.sleep_ms(5) 
             return True
@@ -41,13 +73,13 @@ class NFCManager():
     def read_pages(self, start_page, num_pages):
         """
         Reads multiple pages starting from start_page.
+        The tag answers one 16-byte block per read, so each page is read
+        straight into its slot of a preallocated buffer.
         """
-        data = bytearray()
+        data = bytearray(16 * num_pages)
+        view = memoryview(data)
         for i in range(num_pages):
-            page_data = self.read_page(start_page + i)
-            if page_data:
-                data.extend(page_data)
-            else:
+            if not self._read_page_into(start_page + i, view[i*16 : (i+1)*16]):
                 return None
         return data
 
@@ -61,8 +93,9 @@ class NFCManager():
             return False
         
         num_pages = len(data) // 16
+        view = memoryview(data)
         for i in range(num_pages):
-            chunk = data[i*16 : (i+1)*16]
+            chunk = view[i*16 : (i+1)*16]
             if not self.write_page(start_page + i, chunk):
                 return False
         return True
@@ -73,20 +106,13 @@ class NFCManager():
         This allows a phone to open the URL when scanned.
         """
         # Identify protocol prefix to save bytes
-        prefix = 0x00
-        body = url
-        if url.startswith("http://www."):
-            prefix = 0x01
-            body = url[11:]
-        elif url.startswith("https://www."):
-            prefix = 0x02
-            body = url[12:]
-        elif url.startswith("http://"):
-            prefix = 0x03
-            body = url[7:]
-        elif url.startswith("https://"):
-            prefix = 0x04
-            body = url[8:]
+        for start, prefix in _NDEF_PREFIXES:
+            if url.startswith(start):
+                body = url[len(start):]
+                break
+        else:
+            prefix = 0x00
+            body = url
             
         payload = bytes([prefix]) + body.encode('utf-8')
         